@@ -19,28 +19,70 @@ KEY IDEAS:
 
 from __future__ import annotations
 
+import os
 import time
 import threading
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List
+from functools import lru_cache
+from queue import SimpleQueue
+from typing import Callable, List, Optional
+
+try:
+    # Optional: Numba compiles Python functions to machine code.
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# ------------------------------------------------------------
+# 0) Cheap logging from worker threads
+# ------------------------------------------------------------
+
+# print() takes the sys.stdout lock on every call, so many workers printing
+# at once end up queuing behind each other on that lock.
+# deque.append is atomic in CPython, so workers can record messages without
+# any extra locking; the main thread prints them once the work is done.
+_log: deque = deque()
+
+
+def record(msg: str) -> None:
+    """Store a (timestamp, message) pair instead of printing right away."""
+    _log.append((time.perf_counter(), msg))
+
+
+def drain_log(start: float) -> None:
+    """
+    Print (and clear) all recorded messages, from the main thread.
+
+    Timestamps are shown relative to 'start' (the run's perf_counter()
+    value), since raw perf_counter() values have no meaning on their own.
+    """
+    while _log:
+        ts, msg = _log.popleft()
+        print(f"  +{ts - start:.3f}s {msg}")
 
 
 # ------------------------------------------------------------
 # 1) A fake I/O-bound function
 # ------------------------------------------------------------
 
-def fake_download(url: str, delay: float) -> str:
+def fake_download(url: str, delay: float, out: Optional[SimpleQueue] = None) -> str:
     """
     Simulate a blocking I/O task (e.g. HTTP download).
 
     - Uses time.sleep to block the thread (like waiting for network).
-    - Prints which thread is doing the work.
+    - Records which thread is doing the work (see record()).
+    - If 'out' is given, the worker also publishes (url, result) there directly.
     """
     thread_name = threading.current_thread().name
-    print(f"[START] {url} on {thread_name}, sleeping for {delay:.1f}s")
+    record(f"[START] {url} on {thread_name}, sleeping for {delay:.1f}s")
     time.sleep(delay)  # BLOCKS this thread
-    print(f"[END]   {url} on {thread_name}")
-    return f"content-of-{url}"
+    record(f"[END]   {url} on {thread_name}")
+    data = f"content-of-{url}"
+    if out is not None:
+        out.put((url, data))
+    return data
 
 
 def run_io_sequential(urls: List[str]) -> None:
@@ -56,10 +98,11 @@ def run_io_sequential(urls: List[str]) -> None:
         results.append(result)
 
     elapsed = time.perf_counter() - start
+    drain_log(start)
     print(f"[SEQUENTIAL] Got {len(results)} results in {elapsed:.2f}s\n")
 
 
-def run_io_with_threads(urls: List[str], max_workers: int = 4) -> None:
+def run_io_with_threads(urls: List[str], max_workers: Optional[int] = None) -> None:
     """
     Run fake_download concurrently using ThreadPoolExecutor.
 
@@ -67,43 +110,60 @@ def run_io_with_threads(urls: List[str], max_workers: int = 4) -> None:
     - We create a pool with N threads.
     - We submit tasks to this pool.
     - Each task runs in a worker thread (and can block independently).
+
+    By default N = one thread per URL (capped at 32): I/O threads mostly
+    wait, so more threads than cores is fine, but idle ones are useless.
     """
+    if max_workers is None:
+        max_workers = max(1, min(32, len(urls)))
+
     start = time.perf_counter()
-    results = []
+    # SimpleQueue is a C-implemented, thread-safe queue: workers put their
+    # results into it directly, no extra lock needed on our side.
+    results: SimpleQueue = SimpleQueue()
 
     # Create a pool of worker threads
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         # Submit returns a Future immediately (task scheduled)
         future_to_url = {
-            executor.submit(fake_download, url, 1.0): url
+            executor.submit(fake_download, url, 1.0, results): url
             for url in urls
         }
 
-        # as_completed iterates futures as they finish (any order)
+        # as_completed iterates futures as they finish (any order).
+        # Results already arrived through the queue; here we only check errors.
         for future in as_completed(future_to_url):
             url = future_to_url[future]
-            try:
-                data = future.result()
-            except Exception as exc:
+            exc = future.exception()
+            if exc is not None:
                 print(f"[THREAD-ERROR] {url!r} generated an exception: {exc!r}")
-            else:
-                print(f"[THREAD-OK] {url!r} -> {data!r}")
-                results.append(data)
+
+    collected = []
+    while not results.empty():
+        url, data = results.get_nowait()
+        record(f"[THREAD-OK] {url!r} -> {data!r}")
+        collected.append(data)
 
     elapsed = time.perf_counter() - start
-    print(f"[THREADED] Got {len(results)} results in {elapsed:.2f}s with max_workers={max_workers}\n")
+    drain_log(start)
+    print(f"[THREADED] Got {len(collected)} results in {elapsed:.2f}s with max_workers={max_workers}\n")
 
 
 # ------------------------------------------------------------
 # 2) A fake CPU-bound function (to show threads don't help much)
 # ------------------------------------------------------------
 
+@lru_cache(maxsize=128)
 def cpu_heavy(n: int) -> int:
     """
     Simulate a CPU-heavy task: sum of squares up to n.
 
     This is pure Python number crunching, no I/O.
 
+    The result only depends on n, so it is memoized with lru_cache:
+    calling it again with the same n is just a dict lookup. On such a
+    cache hit the body does not run at all, so no [CPU] lines are logged.
+
     Because of the GIL:
     - Multiple threads doing this in parallel will NOT speed it up
       much (and can even be slower due to thread overhead).
@@ -111,14 +171,33 @@ def cpu_heavy(n: int) -> int:
     For real CPU-bound speedups, we'll later use multiprocessing.
     """
     thread_name = threading.current_thread().name
-    print(f"[CPU] Starting heavy computation({n}) on {thread_name}")
+    record(f"[CPU] Starting heavy computation({n}) on {thread_name}")
     total = 0
     for i in range(n):
         total += i * i
-    print(f"[CPU] Done heavy computation({n}) on {thread_name}")
+    record(f"[CPU] Done heavy computation({n}) on {thread_name}")
     return total
 
 
+# ------------------------------------------------------------
+# 2b) The same work compiled with Numba (optional)
+# ------------------------------------------------------------
+
+# nogil=True makes the compiled function RELEASE the GIL while it runs.
+# This is how C extensions (NumPy, Numba, ...) let threads really run in
+# parallel on several cores - the pure Python loop above never can.
+if njit is not None:
+    @njit(nogil=True, cache=True)
+    def cpu_heavy_nogil(n: int) -> int:
+        """Sum of squares up to n, compiled to native code without the GIL."""
+        total = 0
+        for i in range(n):
+            total += i * i
+        return total
+else:
+    cpu_heavy_nogil = None
+
+
 def run_cpu_sequential(tasks: List[int]) -> None:
     """
     Run cpu_heavy sequentially.
@@ -126,22 +205,34 @@ def run_cpu_sequential(tasks: List[int]) -> None:
     start = time.perf_counter()
     results = [cpu_heavy(n) for n in tasks]
     elapsed = time.perf_counter() - start
+    drain_log(start)
     print(f"[CPU-SEQUENTIAL] Completed {len(results)} tasks in {elapsed:.2f}s\n")
 
 
-def run_cpu_with_threads(tasks: List[int], max_workers: int = 4) -> None:
+def run_cpu_with_threads(
+    tasks: List[int],
+    max_workers: Optional[int] = None,
+    func: Callable[[int], int] = cpu_heavy,
+) -> None:
     """
-    Run cpu_heavy with a ThreadPoolExecutor.
+    Run cpu_heavy (or another CPU-bound func) with a ThreadPoolExecutor.
 
     EXPECTATION in CPython:
     - Not much faster than sequential (sometimes even slower),
       because GIL prevents true parallel CPU execution.
+    - Unless func releases the GIL (see cpu_heavy_nogil).
+
+    By default N = number of CPU cores: more threads than cores can never
+    help CPU-bound work.
     """
+    if max_workers is None:
+        max_workers = os.cpu_count() or 1
+
     start = time.perf_counter()
     results = []
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        futures = [executor.submit(cpu_heavy, n) for n in tasks]
+        futures = [executor.submit(func, n) for n in tasks]
 
         for future in as_completed(futures):
             try:
@@ -152,6 +243,7 @@ def run_cpu_with_threads(tasks: List[int], max_workers: int = 4) -> None:
                 results.append(result)
 
     elapsed = time.perf_counter() - start
+    drain_log(start)
     print(f"[CPU-THREADED] Completed {len(results)} tasks in {elapsed:.2f}s with max_workers={max_workers}\n")
 
 
@@ -165,6 +257,8 @@ def main() -> None:
 
     1) I/O-bound fake download (sequential vs threads)
     2) CPU-bound work (sequential vs threads)
+    3) The same CPU-bound calls again, answered from lru_cache
+    4) CPU-bound work that releases the GIL (only if numba is installed)
     """
     urls = [f"http://example.com/resource-{i}" for i in range(6)]
 
@@ -172,7 +266,7 @@ def main() -> None:
     run_io_sequential(urls)
 
     print("=== I/O-BOUND: THREADED ===")
-    run_io_with_threads(urls, max_workers=4)
+    run_io_with_threads(urls)
 
     # For CPU demo, use moderately big numbers
     cpu_tasks = [5_000_00, 6_000_00, 7_000_00, 8_000_00]  # adjust if needed
@@ -180,8 +274,26 @@ def main() -> None:
     print("=== CPU-BOUND: SEQUENTIAL ===")
     run_cpu_sequential(cpu_tasks)
 
+    # The sequential run above filled the cache. Clear it, otherwise the
+    # threaded run would only measure cache hits, not real computation.
+    cpu_heavy.cache_clear()
+
     print("=== CPU-BOUND: THREADED ===")
-    run_cpu_with_threads(cpu_tasks, max_workers=4)
+    run_cpu_with_threads(cpu_tasks)
+
+    # The threaded run filled the cache again, so now every call is a hit:
+    # near-zero time, and no [CPU] lines because the body never runs.
+    print("=== CPU-BOUND: SEQUENTIAL AGAIN (lru_cache hits) ===")
+    run_cpu_sequential(cpu_tasks)
+    print(f"{cpu_heavy.cache_info()}\n")
+
+    if cpu_heavy_nogil is not None:
+        # The first call triggers JIT compilation; do it once up front so the
+        # timing below only measures the actual work.
+        cpu_heavy_nogil(1)
+
+        print("=== CPU-BOUND: THREADED (Numba, GIL released) ===")
+        run_cpu_with_threads(cpu_tasks, func=cpu_heavy_nogil)
 
 
 if __name__ == "__main__":
@@ -14,7 +14,9 @@ Topics covered:
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import List
+import math
 import uuid
 
 
@@ -59,8 +61,16 @@ class Point:
     x: float
     y: float
 
-    def distance_from_origin(self) -> float:
-        return (self.x**2 + self.y**2) ** 0.5
+    @cached_property
+    def distance(self) -> float:
+        """
+        Distance from the origin, computed once and then cached.
+
+        Safe because the point is frozen, so x and y never change.
+        cached_property stores the value directly in the instance __dict__,
+        which bypasses the frozen __setattr__ check.
+        """
+        return math.hypot(self.x, self.y)
 
 
 # ----------------------------------------------------------
@@ -111,7 +121,7 @@ if __name__ == "__main__":
     print("\n=== Frozen Dataclass ===")
     point = Point(3, 4)
     print(point)
-    print("Distance:", point.distance_from_origin())
+    print("Distance:", point.distance)
     #point.x = 10  # ERROR: Cannot modify frozen dataclass
 
     print("\n=== Post-init validation ===")
@@ -11,8 +11,11 @@ Topics covered:
 - Using functools.wraps (very important!)
 - Practical decorators (logging, timing)
 - Method decorators inside classes
+- Generating specialized wrappers with exec (like dataclasses does)
 """
 
+import inspect
+import itertools
 import time
 from functools import wraps
 
@@ -52,6 +55,60 @@ def say_message(msg):
     print("Message:", msg)
 
 
+# ----------------------------------------------------------
+# EXAMPLE 1b: Same decorator, but with a generated wrapper
+# ----------------------------------------------------------
+
+_SIMPLE_KINDS = (
+    inspect.Parameter.POSITIONAL_ONLY,
+    inspect.Parameter.POSITIONAL_OR_KEYWORD,
+)
+
+
+def specialized_decorator(func):
+    """
+    Same behavior as simple_decorator, but the wrapper is generated
+    from source code that matches func's exact parameters:
+
+        def wrapper(a, b):            # instead of (*args, **kwargs)
+            ...
+            _result = _func(a, b)
+
+    This skips packing/unpacking *args/**kwargs on every call.
+    dataclasses and attrs use the same trick to build __init__.
+
+    Falls back to simple_decorator for anything that is not a plain
+    list of positional parameters (defaults, *args, keyword-only, ...).
+    """
+    params = list(inspect.signature(func).parameters.values())
+    names = [p.name for p in params]
+
+    if (
+        any(p.kind not in _SIMPLE_KINDS or p.default is not p.empty for p in params)
+        or {"_func", "_result", "_print"} & set(names)
+    ):
+        return simple_decorator(func)
+
+    arglist = ", ".join(names)
+    source = (
+        f"def wrapper({arglist}):\n"
+        f"    _print('[DEBUG] Before function call')\n"
+        f"    _result = _func({arglist})\n"
+        f"    _print('[DEBUG] After function call')\n"
+        f"    return _result\n"
+    )
+    # The wrapper only uses names we put here, so a parameter called
+    # e.g. "print" can't shadow what the wrapper calls.
+    namespace = {"_func": func, "_print": print}
+    exec(source, namespace)
+    return wraps(func)(namespace["wrapper"])
+
+
+@specialized_decorator
+def add_numbers(a, b):
+    return a + b
+
+
 # ----------------------------------------------------------
 # EXAMPLE 2: Decorator with arguments
 # ----------------------------------------------------------
@@ -62,7 +119,10 @@ def repeat(n):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            for _ in range(n):
+            # itertools.repeat(None, n) just hands back the same None n
+            # times - a slightly cheaper loop driver than range(n) when the
+            # counter isn't needed (it's what timeit uses internally).
+            for _ in itertools.repeat(None, n):
                 func(*args, **kwargs)
         return wrapper
 
@@ -81,10 +141,11 @@ def beep():
 def measure_time(func):
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.perf_counter()
+        # perf_counter_ns returns an int: exact subtraction, one final division
+        start = time.perf_counter_ns()
         result = func(*args, **kwargs)
-        end = time.perf_counter()
-        print(f"[TIME] {func.__name__} took {(end - start):.6f} seconds")
+        elapsed_ns = time.perf_counter_ns() - start
+        print(f"[TIME] {func.__name__} took {elapsed_ns / 1e9:.6f} seconds")
         return result
     return wrapper
 
@@ -101,6 +162,17 @@ def slow_function():
 
 current_user_role = "admin"
 
+
+def set_current_user_role(role):
+    """Change the current role (same as assigning current_user_role)."""
+    global current_user_role
+    current_user_role = role
+
+
+def get_current_user_role():
+    return current_user_role
+
+
 def require_role(role):
     """Check if the user has permission."""
 
@@ -147,6 +219,9 @@ if __name__ == "__main__":
     print("=== Simple Decorator ===")
     say_message("Hello Decorator")
 
+    print("\n=== Specialized (generated) Decorator ===")
+    print(add_numbers(2, 3))
+
     print("\n=== Decorator with Arguments ===")
     beep()
 
@@ -155,6 +230,9 @@ if __name__ == "__main__":
 
     print("\n=== Access Control Decorator ===")
     delete_database()
+    set_current_user_role("guest")
+    delete_database()  # denied
+    set_current_user_role("admin")
 
     print("\n=== Method Decorator ===")
     calc = Calculator()
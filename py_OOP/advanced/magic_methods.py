@@ -12,12 +12,18 @@ Topics covered:
 - Practical examples
 """
 
+import os
+
 
 # ----------------------------------------------------------
 # EXAMPLE 1: __str__ and __repr__
 # ----------------------------------------------------------
 
 class Person:
+    # __slots__ replaces the per-instance __dict__ with fixed attribute slots:
+    # smaller objects and faster attribute access.
+    __slots__ = ("name", "age")
+
     def __init__(self, name: str, age: int):
         self.name = name
         self.age = age
@@ -36,6 +42,8 @@ class Person:
 # ----------------------------------------------------------
 
 class Vector:
+    __slots__ = ("x", "y")
+
     def __init__(self, x: float, y: float):
         self.x = x
         self.y = y
@@ -55,13 +63,21 @@ class Vector:
 # ----------------------------------------------------------
 
 class Score:
+    __slots__ = ("value",)
+
     def __init__(self, value: int):
         self.value = value
 
     def __eq__(self, other):
+        if self is other:
+            return True
+        if type(other) is not Score:
+            return NotImplemented  # let Python try other.__eq__ / fall back
         return self.value == other.value
 
     def __lt__(self, other):
+        if type(other) is not Score:
+            return NotImplemented
         return self.value < other.value
 
     def __repr__(self):
@@ -73,6 +89,8 @@ class Score:
 # ----------------------------------------------------------
 
 class ShoppingCart:
+    __slots__ = ("items",)
+
     def __init__(self, items):
         self.items = items
 
@@ -96,22 +114,40 @@ class FileManager:
     """
     A custom context manager for opening/closing files.
     Allows usage: with FileManager(...) as f:
+
+    Uses the low-level os.open/os.write API instead of open():
+    no TextIOWrapper, no Python-level buffer - each write() is one syscall.
+    Good for a few small writes; for many tiny writes, join them first.
     """
 
+    _FLAGS = {
+        "w": os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+        "a": os.O_WRONLY | os.O_CREAT | os.O_APPEND,
+    }
+
     def __init__(self, filename, mode):
+        if mode not in self._FLAGS:
+            raise ValueError(f"Unsupported mode: {mode!r} (use 'w' or 'a')")
         self.filename = filename
         self.mode = mode
-        self.file = None
+        self.fd = None
 
     def __enter__(self):
         print("[ENTER] Opening file...")
-        self.file = open(self.filename, self.mode)
-        return self.file
+        self.fd = os.open(self.filename, self._FLAGS[self.mode], 0o644)
+        return self
+
+    def write(self, data):
+        """Write str (encoded as UTF-8) or bytes straight to the file descriptor."""
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+        return os.write(self.fd, data)
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         print("[EXIT] Closing file...")
-        if self.file:
-            self.file.close()
+        if self.fd is not None:
+            os.close(self.fd)
+            self.fd = None
         return False  # Do not suppress exceptions
 
 
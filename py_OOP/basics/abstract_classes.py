@@ -10,7 +10,7 @@ Abstraction and "interfaces" in Python using:
 """
 
 from abc import ABC, abstractmethod
-from typing import Protocol
+from typing import Iterable, List, Protocol
 
 
 # ----------------------------------------------------------
@@ -155,6 +155,17 @@ def announce(entity: SupportsSpeak):
     print("Announcement:", entity.speak())
 
 
+def announce_many(entities: Iterable[SupportsSpeak]) -> List[str]:
+    """
+    Collect what every entity says.
+
+    The .speak lookups are resolved once up front into bound methods,
+    so the second loop only performs plain calls.
+    """
+    methods = [e.speak for e in entities]
+    return [m() for m in methods]
+
+
 # ----------------------------------------------------------
 # Example usage
 # ----------------------------------------------------------
@@ -179,3 +190,5 @@ if __name__ == "__main__":
 
     announce(dog)
     announce(robot)
+
+    print("All together:", announce_many([dog, robot]))
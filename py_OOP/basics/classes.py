@@ -20,6 +20,11 @@ class Car:
     # Class attribute (shared by all Car objects)
     wheels = 4
 
+    # __slots__ lists the instance attributes up front. Instances then get
+    # fixed slots instead of a per-object __dict__: less memory, faster access.
+    # "__engine_number" is name-mangled here too (-> _Car__engine_number).
+    __slots__ = ("brand", "model", "year", "_mileage", "__engine_number")
+
     def __init__(self, brand: str, model: str, year: int):
         """
         Constructor (initializer)
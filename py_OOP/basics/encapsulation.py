@@ -11,11 +11,20 @@ Topics covered:
 - Validation logic
 """
 
+import re
+
+# A PIN is exactly four ASCII digits. The regex is used for correctness,
+# not speed: str.isdigit() (and \d) also accept digits like "٣" or "²",
+# while [0-9] only matches 0-9. Compiled once at import.
+_is_valid_pin = re.compile(r"[0-9]{4}").fullmatch
+
 # ----------------------------------------------------------
 # EXAMPLE 1: Basic encapsulation with protected and private attributes
 # ----------------------------------------------------------
 
 class BankAccount:
+    __slots__ = ("owner", "_balance", "__pin_code")
+
     def __init__(self, owner: str, balance: float):
         self.owner = owner                    # public attribute
         self._balance = balance               # protected attribute (by convention)
@@ -32,11 +41,11 @@ class BankAccount:
             return
         self._balance += amount
 
-    # Proper getter/setter for private attribute
+    # Proper getter/setter for private attribute.
+    # Invalid input raises, so callers can handle it with try/except.
     def set_pin(self, new_pin: str):
-        if not new_pin.isdigit() or len(new_pin) != 4:
-            print("PIN must be a 4-digit number.")
-            return
+        if not _is_valid_pin(new_pin):
+            raise ValueError("PIN must be a 4-digit number.")
         self.__pin_code = new_pin
 
     def get_pin(self):
@@ -54,8 +63,15 @@ class TemperatureSensor:
     but with validation logic under the hood.
     """
 
+    __slots__ = ("_celsius", "_fahrenheit")
+
     def __init__(self, celsius: float):
         self._celsius = celsius   # protected storage attribute
+        self._fahrenheit = self._to_fahrenheit(celsius)
+
+    @staticmethod
+    def _to_fahrenheit(celsius: float) -> float:
+        return celsius * 9/5 + 32
 
     # Getter
     @property
@@ -68,11 +84,16 @@ class TemperatureSensor:
         if value < -273.15:
             raise ValueError("Temperature cannot go below absolute zero!")
         self._celsius = value
+        # Keep the cached value in sync - this setter is the only way
+        # to change the temperature.
+        self._fahrenheit = self._to_fahrenheit(value)
 
-    # Read-only computed property
+    # Read-only computed property.
+    # Computed when celsius changes, not on every read: reads are
+    # usually much more frequent than writes.
     @property
     def fahrenheit(self) -> float:
-        return self._celsius * 9/5 + 32
+        return self._fahrenheit
 
 
 # ----------------------------------------------------------
@@ -87,6 +108,11 @@ if __name__ == "__main__":
     acc.set_pin("1234")
     print("PIN:", acc.get_pin())
 
+    try:
+        acc.set_pin("12ab")
+    except ValueError as e:
+        print("Rejected PIN:", e)
+
     # Access protected member (technically possible but discouraged)
     print("Accessing protected attribute:", acc._balance)
 
@@ -16,6 +16,9 @@ Topics covered:
 # ----------------------------------------------------------
 
 class Animal:
+    # Each class in the hierarchy lists only the attributes it adds itself.
+    __slots__ = ("name",)
+
     def __init__(self, name: str):
         self.name = name
 
@@ -33,6 +36,8 @@ class Animal:
 # ----------------------------------------------------------
 
 class Dog(Animal):
+    __slots__ = ("breed",)
+
     def __init__(self, name: str, breed: str):
         # Call the parent constructor
         super().__init__(name)
@@ -52,6 +57,8 @@ class Dog(Animal):
 # ----------------------------------------------------------
 
 class Cat(Animal):
+    __slots__ = ("color",)
+
     def __init__(self, name: str, color: str):
         # Call the parent constructor
         super().__init__(name)
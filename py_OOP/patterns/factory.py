@@ -25,6 +25,13 @@ class Cat:
     def speak(self):
         return "Meow!"
 
+# Lookup table: name -> class. One dict lookup instead of an if/elif chain,
+# and adding a new type is just one more entry.
+_ANIMALS = {
+    "dog": Dog,
+    "cat": Cat,
+}
+
 class AnimalFactory:
     """
     Simple Factory: create object based on input.
@@ -32,12 +39,10 @@ class AnimalFactory:
     @staticmethod
     def create_animal(animal_type: str):
         animal_type = animal_type.lower()
-        if animal_type == "dog":
-            return Dog()
-        elif animal_type == "cat":
-            return Cat()
-        else:
+        cls = _ANIMALS.get(animal_type)
+        if cls is None:
             raise ValueError(f"Unknown animal type: {animal_type}")
+        return cls()
 
 
 # ----------------------------------------------------------
@@ -169,19 +174,21 @@ class SQLite(Database):
         return "Connecting to SQLite"
 
 
+_DATABASES = {
+    "mysql": MySQL,
+    "postgresql": PostgreSQL,
+    "sqlite": SQLite,
+}
+
+
 class DatabaseFactory:
     @staticmethod
     def get_database(db_type: str) -> Database:
         db_type = db_type.lower()
-        match db_type:
-            case "mysql":
-                return MySQL()
-            case "postgresql":
-                return PostgreSQL()
-            case "sqlite":
-                return SQLite()
-            case _:
-                raise ValueError(f"Unknown DB type: {db_type}")
+        cls = _DATABASES.get(db_type)
+        if cls is None:
+            raise ValueError(f"Unknown DB type: {db_type}")
+        return cls()
 
 
 # ----------------------------------------------------------
@@ -14,22 +14,24 @@ Useful for:
 - Reacting to stock price changes, sensor changes, etc.
 """
 
-from abc import ABC, abstractmethod
-from typing import List, Callable, Protocol, Any
+from typing import List, Callable, Protocol, Any, Tuple
 
 
 # ----------------------------------------------------------
 # EXAMPLE 1: Classic OOP Observer
 # ----------------------------------------------------------
 
-class Observer(ABC):
+class Observer(Protocol):
     """
-    Abstract observer that reacts to updates from the Subject.
+    Observer that reacts to updates from the Subject.
+
+    A Protocol (structural type) instead of an ABC: any object with an
+    update(data) method is an Observer, no inheritance needed.
+    The Subject only ever calls obs.update(...), so that's all it requires.
     """
 
-    @abstractmethod
-    def update(self, data: Any):
-        pass
+    def update(self, data: Any) -> None:
+        ...
 
 
 class Subject:
@@ -39,20 +41,30 @@ class Subject:
 
     def __init__(self):
         self._observers: List[Observer] = []
+        # Bound .update methods, rebuilt on attach/detach.
+        # notify() runs far more often than attach/detach, so it
+        # should do as little work as possible.
+        self._callbacks: Tuple[Callable[[Any], None], ...] = ()
         self._state: Any = None
 
+    def _rebuild_callbacks(self):
+        self._callbacks = tuple(obs.update for obs in self._observers)
+
     def attach(self, observer: Observer):
         """Subscribe an observer."""
         self._observers.append(observer)
+        self._rebuild_callbacks()
 
     def detach(self, observer: Observer):
         """Unsubscribe an observer."""
         self._observers.remove(observer)
+        self._rebuild_callbacks()
 
     def notify(self):
         """Notify all observers about the current state."""
-        for obs in self._observers:
-            obs.update(self._state)
+        state = self._state
+        for callback in self._callbacks:
+            callback(state)
 
     def set_state(self, new_state: Any):
         """
@@ -63,7 +75,7 @@ class Subject:
         self.notify()
 
 
-class ConsoleLogger(Observer):
+class ConsoleLogger:
     """
     Observer that logs updates to the console.
     """
@@ -72,7 +84,7 @@ class ConsoleLogger(Observer):
         print(f"[ConsoleLogger] New state: {data}")
 
 
-class AlertSystem(Observer):
+class AlertSystem:
     """
     Observer that raises an alert when threshold exceeded.
     """
@@ -113,15 +125,21 @@ class Event:
 
     def __init__(self):
         self._listeners: List[ListenerFunc] = []
+        # Immutable snapshot used by fire(), rebuilt on add/remove.
+        # A listener that adds/removes listeners while being fired
+        # does not disturb the loop that is currently running.
+        self._snapshot: Tuple[ListenerFunc, ...] = ()
 
     def add_listener(self, listener: ListenerFunc):
         self._listeners.append(listener)
+        self._snapshot = tuple(self._listeners)
 
     def remove_listener(self, listener: ListenerFunc):
         self._listeners.remove(listener)
+        self._snapshot = tuple(self._listeners)
 
     def fire(self, data: Any):
-        for listener in self._listeners:
+        for listener in self._snapshot:
             listener(data)
 
 
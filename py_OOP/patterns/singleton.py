@@ -16,6 +16,9 @@ We will implement:
 
 import threading
 
+# Sentinel for "not created yet" (None could be a legitimate value).
+_MISSING = object()
+
 
 # ----------------------------------------------------------
 # EXAMPLE 1: Classic Singleton with __new__
@@ -23,15 +26,24 @@ import threading
 
 class ClassicSingleton:
     _instance = None
+    __slots__ = ("value", "_initialized")
 
     def __new__(cls, *args, **kwargs):
         """Control instance creation."""
         if cls._instance is None:
-            cls._instance = super().__new__(cls)
+            instance = super().__new__(cls)
+            instance._initialized = False
+            cls._instance = instance
         return cls._instance
 
     def __init__(self, value):
+        # __init__ runs after EVERY ClassicSingleton(...) call, even when
+        # __new__ returned the existing instance. Without this guard the
+        # second call would overwrite value.
+        if self._initialized:
+            return
         self.value = value
+        self._initialized = True
 
     def __repr__(self):
         return f"ClassicSingleton(id={id(self)}, value={self.value})"
@@ -42,12 +54,15 @@ class ClassicSingleton:
 # ----------------------------------------------------------
 
 def singleton(cls):
-    instances = {}
+    # Each decorated class gets its own get_instance closure, so a single
+    # variable is enough - no dict keyed by class needed.
+    instance = None
 
     def get_instance(*args, **kwargs):
-        if cls not in instances:
-            instances[cls] = cls(*args, **kwargs)
-        return instances[cls]
+        nonlocal instance
+        if instance is None:
+            instance = cls(*args, **kwargs)
+        return instance
 
     return get_instance
 
@@ -75,9 +90,12 @@ class SingletonMeta(type):
 
     def __call__(cls, *args, **kwargs):
         # Called when you do: MyClass()
-        if cls not in cls._instances:
-            cls._instances[cls] = super().__call__(*args, **kwargs)
-        return cls._instances[cls]
+        # One dict lookup (get) instead of two ("in" + [cls]).
+        instance = cls._instances.get(cls, _MISSING)
+        if instance is _MISSING:
+            instance = super().__call__(*args, **kwargs)
+            cls._instances[cls] = instance
+        return instance
 
 
 class MetaSingleton(metaclass=SingletonMeta):
@@ -97,13 +115,25 @@ class ThreadSafeSingleton:
     _lock = threading.Lock()
 
     def __new__(cls, message):
-        with cls._lock:
-            if cls._instance is None:
-                cls._instance = super().__new__(cls)
-        return cls._instance
+        # Double-checked locking: once the instance exists, we return it
+        # without touching the lock. Only the very first calls (when it may
+        # still be None) pay for the lock, and re-check inside it.
+        instance = cls._instance
+        if instance is None:
+            with cls._lock:
+                instance = cls._instance
+                if instance is None:
+                    instance = super().__new__(cls)
+                    cls._instance = instance
+        return instance
 
     def __init__(self, message):
+        # Python calls __init__ after every __new__, even when __new__
+        # returned the existing instance - only initialize once.
+        if getattr(self, "_initialized", False):
+            return
         self.message = message
+        self._initialized = True
 
     def __repr__(self):
         return f"ThreadSafeSingleton(id={id(self)}, message={self.message})"
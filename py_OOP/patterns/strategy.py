@@ -9,86 +9,64 @@ Idea:
 - Let the caller choose which strategy to use at runtime
 
 We will implement:
-1. Classic OOP Strategy with ABC
+1. Strategies as plain callables (functions and closures)
 2. Using the strategy inside a Context class
-3. Pythonic Strategy using simple functions
+3. Picking a strategy by name with a dict
+4. Applying a strategy to many prices at once (NumPy-friendly)
 """
 
-from abc import ABC, abstractmethod
-from typing import Protocol, Callable
+from typing import Dict, List, Protocol, Sequence
 
 
 # ----------------------------------------------------------
-# EXAMPLE 1: Classic OOP Strategy – discount calculation
+# EXAMPLE 1: Strategies as callables – discount calculation
 # ----------------------------------------------------------
 
-class DiscountStrategy(ABC):
-    """
-    Abstract base class representing a discount strategy.
-    """
-
-    @abstractmethod
-    def apply_discount(self, price: float) -> float:
-        pass
-
-
-class NoDiscount(DiscountStrategy):
-    def apply_discount(self, price: float) -> float:
-        return price
-
-
-class PercentageDiscount(DiscountStrategy):
-    def __init__(self, percent: float):
-        self.percent = percent
-
-    def apply_discount(self, price: float) -> float:
-        return price * (1 - self.percent / 100.0)
-
-
-class FixedAmountDiscount(DiscountStrategy):
-    def __init__(self, amount: float):
-        self.amount = amount
-
-    def apply_discount(self, price: float) -> float:
-        result = price - self.amount
-        return max(result, 0)  # no negative prices
+# A Protocol describing our function-based strategy (for type checkers).
+# In other languages this would be an abstract class/interface with an
+# apply_discount() method. In Python, any callable price -> price will do.
+#
+# All strategies below use only arithmetic and comparisons (no if/max),
+# so they work both for a single float and for a whole NumPy array.
+class DiscountFunc(Protocol):
+    def __call__(self, price: float) -> float:
+        ...
 
 
-class BlackFridayDiscount(DiscountStrategy):
-    def apply_discount(self, price: float) -> float:
-        # Just a crazy discount for demo purposes :)
-        return price * 0.5
+def no_discount(price: float) -> float:
+    return price
 
 
-class PriceCalculator:
+def percentage(percent: float) -> DiscountFunc:
     """
-    Context class that uses a DiscountStrategy.
-    It doesn't care *which* strategy is used.
+    Build a "percent off" strategy.
+
+    The factor is computed once, here. The returned closure keeps it in a
+    cell, so each call is a single multiplication - no self.percent lookup.
     """
+    factor = 1 - percent / 100.0
 
-    def __init__(self, strategy: DiscountStrategy):
-        self.strategy = strategy
+    def apply(price: float) -> float:
+        return price * factor
 
-    def set_strategy(self, strategy: DiscountStrategy):
-        """Change strategy at runtime."""
-        self.strategy = strategy
+    return apply
 
-    def calculate_price(self, base_price: float) -> float:
-        return self.strategy.apply_discount(base_price)
 
+def fixed_amount(amount: float) -> DiscountFunc:
+    """Build a "fixed amount off" strategy (never below zero)."""
 
-# ----------------------------------------------------------
-# EXAMPLE 2: Pythonic Strategy – functions instead of classes
-# ----------------------------------------------------------
+    def apply(price: float) -> float:
+        # Same as max(price - amount, 0), written so it also works
+        # element-wise on arrays: (x + |x|) / 2 is x if x > 0, else 0.
+        diff = price - amount
+        return (diff + abs(diff)) / 2  # no negative prices
 
-# A Protocol describing our function-based strategy (for type checkers)
-class DiscountFunc(Protocol):
-    def __call__(self, price: float) -> float:
-        ...
+    return apply
 
 
-def no_discount(price: float) -> float:
-    return price
+def black_friday(price: float) -> float:
+    # Just a crazy discount for demo purposes :)
+    return price * 0.5
 
 
 def vip_discount(price: float) -> float:
@@ -100,56 +78,98 @@ def student_discount(price: float) -> float:
 
 
 def special_event_discount(price: float) -> float:
-    if price > 100:
-        return price - 30  # flat 30 off for big purchases
-    return price
+    # flat 30 off for big purchases (price > 100)
+    return price - 30 * (price > 100)
 
 
-class FunctionalPriceCalculator:
+# ----------------------------------------------------------
+# EXAMPLE 2: Context class using a strategy
+# ----------------------------------------------------------
+
+class PriceCalculator:
     """
-    Strategy via callables (functions) instead of classes.
-    Very Pythonic and lightweight.
+    Context class that uses a discount strategy.
+    It doesn't care *which* strategy is used - it just calls it.
     """
 
     def __init__(self, strategy: DiscountFunc):
         self.strategy = strategy
 
     def set_strategy(self, strategy: DiscountFunc):
+        """Change strategy at runtime."""
         self.strategy = strategy
 
     def calculate_price(self, base_price: float) -> float:
         return self.strategy(base_price)
 
+    def calculate_prices(self, prices: Sequence[float]) -> Sequence[float]:
+        """
+        Apply the strategy to many prices.
+
+        A NumPy array is passed to the strategy in ONE call, so the math
+        runs in C over the whole array. Other sequences fall back to
+        calling the strategy once per price.
+        """
+        if hasattr(prices, "dtype"):
+            return self.strategy(prices)
+        return list(map(self.strategy, prices))
+
+
+# ----------------------------------------------------------
+# EXAMPLE 3: Choosing a strategy by name
+# ----------------------------------------------------------
+
+# Useful when the choice comes from config, user input, a database...
+DISCOUNTS: Dict[str, DiscountFunc] = {
+    "none": no_discount,
+    "vip": vip_discount,
+    "student": student_discount,
+    "special_event": special_event_discount,
+    "black_friday": black_friday,
+}
+
+
+def get_discount(name: str) -> DiscountFunc:
+    try:
+        return DISCOUNTS[name]
+    except KeyError:
+        raise ValueError(f"Unknown discount: {name}") from None
+
 
 # ----------------------------------------------------------
 # Example usage
 # ----------------------------------------------------------
 if __name__ == "__main__":
-    print("=== Classic Strategy Pattern ===")
+    print("=== Strategy Pattern ===")
     base_price = 200.0
 
     # Choose strategy at runtime:
-    calc = PriceCalculator(NoDiscount())
+    calc = PriceCalculator(no_discount)
     print("No discount:           ", calc.calculate_price(base_price))
 
-    calc.set_strategy(PercentageDiscount(10))
+    calc.set_strategy(percentage(10))
     print("10% discount:          ", calc.calculate_price(base_price))
 
-    calc.set_strategy(FixedAmountDiscount(50))
+    calc.set_strategy(fixed_amount(50))
     print("50 off:                ", calc.calculate_price(base_price))
 
-    calc.set_strategy(BlackFridayDiscount())
+    calc.set_strategy(black_friday)
     print("Black Friday (50% off):", calc.calculate_price(base_price))
 
-    print("\n=== Functional Strategy (Pythonic) ===")
-    fcalc = FunctionalPriceCalculator(no_discount)
-    print("No discount:           ", fcalc.calculate_price(base_price))
-
-    fcalc.set_strategy(vip_discount)
-    print("VIP discount (20% off):", fcalc.calculate_price(base_price))
-
-    fcalc.set_strategy(student_discount)
-    print("Student discount (10%):", fcalc.calculate_price(base_price))
-
-    fcalc.set_strategy(special_event_discount)
-    print("Special event:         ", fcalc.calculate_price(base_price))
+    print("\n=== Strategy chosen by name ===")
+    for name in ("vip", "student", "special_event"):
+        calc.set_strategy(get_discount(name))
+        print(f"{name + ':':23}", calc.calculate_price(base_price))
+
+    print("\n=== Many prices at once ===")
+    prices: List[float] = [20.0, 80.0, 150.0, 400.0]
+    calc.set_strategy(fixed_amount(50))
+    print("50 off (list):         ", calc.calculate_prices(prices))
+
+    try:
+        import numpy as np
+    except ImportError:
+        print("(install numpy to see the vectorized version)")
+    else:
+        calc.set_strategy(special_event_discount)
+        print("Special event (array): ", calc.calculate_prices(np.array(prices)))
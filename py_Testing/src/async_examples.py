@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Protocol
+from typing import Iterable, List, Protocol
+
+# Bound once at import: calling _upper(raw) skips looking up
+# the .upper method on every string.
+_upper = str.upper
 
 
 class AsyncClient(Protocol):
@@ -40,12 +44,39 @@ async def fetch_and_upper(client: AsyncClient, key: str) -> str:
 
     This is designed for testing AsyncMock:
       - we await an async method (client.get_data)
-      - we do some extra async work (sleep)
       - we return a transformed value
+
+    str.upper() is plain synchronous work, so there is no reason to
+    suspend (await) around it - that would only add an extra trip
+    through the event loop.
     """
     raw = await client.get_data(key)
-    await asyncio.sleep(0.01)
-    return raw.upper()
+    return _upper(raw)
+
+
+async def fetch_and_upper_many(
+    client: AsyncClient, keys: Iterable[str], concurrency: int = 32
+) -> List[str]:
+    """
+    Run fetch_and_upper for many keys concurrently.
+
+    Total time is roughly the slowest fetch instead of the sum of all.
+    A semaphore keeps at most 'concurrency' fetches in flight at once,
+    so a long key list doesn't open hundreds of connections.
+    Results are returned in the same order as 'keys'.
+
+    Raises:
+        ValueError: if concurrency < 1 (nothing could ever run).
+    """
+    if concurrency < 1:
+        raise ValueError("concurrency must be at least 1")
+    sem = asyncio.Semaphore(concurrency)
+
+    async def one(key: str) -> str:
+        async with sem:
+            return await fetch_and_upper(client, key)
+
+    return await asyncio.gather(*(one(k) for k in keys))
 
 
 async def wait_for_value(coro, timeout: float):
@@ -1,5 +1,14 @@
 from __future__ import annotations
 
+from typing import Iterable, List
+
+try:
+    # Optional: compile the hot loop to machine code when numba is installed.
+    from numba import njit
+except ImportError:
+    njit = None
+
+
 def add(a: float, b: float) -> float:
     """Return the sum of two numbers."""
     return a + b
@@ -17,22 +26,91 @@ def divide(a: float, b: float) -> float:
     return a / b
 
 
-def is_prime(n: int) -> bool:
+def _sieve(limit: int) -> bytearray:
     """
-    Return True if n is a prime number.
+    Sieve of Eratosthenes: flags[i] == 1 iff i is prime, for 0 <= i <= limit.
 
-    Simple implementation; good enough for testing practice.
+    Crossing out multiples is done with slice assignment, which runs in C
+    over the whole stride at once instead of one Python step per number.
     """
+    flags = bytearray([1]) * (limit + 1)
+    flags[:2] = b"\x00\x00"[: limit + 1]
+    for i in range(2, int(limit ** 0.5) + 1):
+        if flags[i]:
+            flags[i * i::i] = bytes(len(range(i * i, limit + 1, i)))
+    return flags
+
+
+def primes_up_to(n: int) -> List[int]:
+    """Return all primes <= n, in increasing order."""
     if n < 2:
-        return False
-    if n in (2, 3):
-        return True
-    if n % 2 == 0:
+        return []
+    return [i for i, is_p in enumerate(_sieve(n)) if is_p]
+
+
+_SMALL_LIMIT = 10_000
+_SMALL_PRIMES = frozenset(primes_up_to(_SMALL_LIMIT - 1))
+
+# Above this, a batch is checked number by number instead of sieving
+# everything up to its maximum (the sieve needs max+1 bytes of memory).
+_BATCH_SIEVE_LIMIT = 10_000_000
+
+
+def _trial_division(n: int) -> bool:
+    """Primality of n >= 5 by trial division with 6k +/- 1 candidates."""
+    if n % 2 == 0 or n % 3 == 0:
         return False
 
-    i = 3
-    while i * i <= n:
-        if n % i == 0:
+    i = 5
+    # i <= n // i rather than i * i <= n: for n near 2**63 the square
+    # overflows int64 in the compiled (numba) version.
+    while i <= n // i:
+        if n % i == 0 or n % (i + 2) == 0:
             return False
-        i += 2
+        i += 6
     return True
+
+
+# With numba, compile the loop ahead of the first call: the explicit
+# signature makes compilation happen here (at import), and cache=True
+# stores the machine code on disk so later runs skip compiling entirely.
+# The compiled version only takes int64, so huge ints use the Python one.
+_INT64_MAX = 2 ** 63 - 1
+if njit is not None:
+    _trial_division_native = njit("boolean(int64)", cache=True)(_trial_division)
+else:
+    _trial_division_native = _trial_division
+
+
+def is_prime(n: int) -> bool:
+    """
+    Return True if n is a prime number.
+
+    Small numbers are answered from a precomputed table.
+    Larger ones use trial division by 6k +/- 1 only: every prime > 3
+    has that form, so multiples of 2 and 3 are never tried.
+    """
+    if n < _SMALL_LIMIT:
+        return n in _SMALL_PRIMES
+    if n <= _INT64_MAX:
+        return bool(_trial_division_native(n))
+    return _trial_division(n)
+
+
+def is_prime_batch(numbers: Iterable[int]) -> List[bool]:
+    """
+    Return [is_prime(n) for n in numbers], but faster for many numbers.
+
+    When the largest number is small enough, one sieve up to it answers
+    every number with an index lookup.
+    """
+    numbers = list(numbers)
+    if not numbers:
+        return []
+
+    top = max(numbers)
+    if top > _BATCH_SIEVE_LIMIT:
+        return [is_prime(n) for n in numbers]
+
+    flags = _sieve(max(top, 1))
+    return [n >= 0 and flags[n] == 1 for n in numbers]
@@ -1,13 +1,24 @@
 import requests
+from requests.adapters import HTTPAdapter
+
+# One shared Session for the whole module: it keeps connections open
+# (keep-alive), so repeated requests to the same host reuse the TCP/TLS
+# connection instead of doing a new handshake every time.
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=32, pool_maxsize=32))
+
+TIMEOUT = 10  # seconds
+
 
 def fetch_data(url: str) -> str:
     """
     Fetch text data from a URL.
 
-    - Uses requests.get(url)
+    - Uses the shared module Session (_SESSION.get)
     - Raises any HTTP-related errors via response.raise_for_status()
     - Returns response.text on success
     """
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=TIMEOUT)
     response.raise_for_status()
     return response.text
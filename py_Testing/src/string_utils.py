@@ -1,12 +1,25 @@
+from functools import lru_cache
+
 import requests
+from requests.adapters import HTTPAdapter
+
+# Shared Session: connections to the same host are kept open and reused
+# (same idea as in network.py).
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+_SESSION.mount("http://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
+TIMEOUT = 10  # seconds
+
 
 def download_text(url: str) -> str:
-    """Download text content from a URL."""
-    resp = requests.get(url)
+    """Download text content from a URL (via the shared module Session)."""
+    resp = _SESSION.get(url, timeout=TIMEOUT)
     resp.raise_for_status()
     return resp.text
 
 
+@lru_cache(maxsize=1024)
 def word_count(text: str) -> int:
-    """Return the number of words in a string."""
+    """Return the number of words in a string (memoized - it's a pure function)."""
     return len(text.split())
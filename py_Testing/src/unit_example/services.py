@@ -10,17 +10,13 @@ def create_order(path: Path, customer: str, amount: float) -> Dict[str, Any]:
     """
     Create a new order and persist it to disk.
 
-    - Uses storage.init_storage() to ensure file exists
-    - Loads existing orders
-    - Assigns a new incremental 'id'
-    - Saves all orders back to the file
+    - Assigns a new incremental 'id' (via storage.allocate_id)
+    - Appends the order to the file (created on first use; existing
+      orders are not rewritten)
     - Returns the created order dict
     """
-    storage.init_storage(path)
-    orders = storage.load_orders(path)
-
     # simple incremental ID (not for production, just for demo)
-    new_id = (max(o["id"] for o in orders) + 1) if orders else 1
+    new_id = storage.allocate_id(path)
 
     order = {
         "id": new_id,
@@ -28,15 +24,19 @@ def create_order(path: Path, customer: str, amount: float) -> Dict[str, Any]:
         "amount": amount,
     }
 
-    orders.append(order)
-    storage.save_orders(path, orders)
+    storage.append_order(path, order)
     return order
 
 
 def get_orders_for_customer(path: Path, customer: str) -> List[Dict[str, Any]]:
     """
     Return all orders for a given customer, reading from the storage file.
+
+    Uses storage.orders_by_customer(), which keeps a per-customer index
+    of the file, so many lookups don't re-scan every order.
+    A missing file simply means there are no orders yet.
     """
-    storage.init_storage(path)
-    orders = storage.load_orders(path)
-    return [o for o in orders if o["customer"] == customer]
+    try:
+        return storage.orders_by_customer(path, customer)
+    except FileNotFoundError:
+        return []
@@ -1,35 +1,183 @@
 from __future__ import annotations
 
 import json
+import mmap
+import os
+import re
+from collections import defaultdict
+from functools import lru_cache, partial
 from pathlib import Path
 from typing import List, Dict, Any
 
+try:
+    # orjson is a fast JSON library written in Rust. It reads/writes bytes
+    # directly, so there is no separate str encode/decode step.
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+    if orjson is not None:
+        return orjson.loads(data)  # also accepts memoryview
+    if isinstance(data, memoryview):
+        data = data.tobytes()  # stdlib json needs bytes or str
+    return json.loads(data)
+
+
+# Files at least this big are memory-mapped instead of read into one
+# bytes object. For tiny files setting up the mapping costs more than
+# it saves.
+_MMAP_MIN_SIZE = 4096
+
+# Older files hold one JSON list: first non-whitespace byte is "[".
+_is_legacy_list = re.compile(rb"\s*\[").match
+
 
 def init_storage(path: Path) -> None:
     """
     Initialize the storage file.
 
-    If the file does not exist, it creates it with an empty list: [].
+    The file uses JSON Lines (NDJSON): one JSON object (order) per line.
+    If the file does not exist, it creates it empty (= no orders).
     If it exists, it leaves it as is.
     """
     if not path.exists():
-        path.write_text("[]", encoding="utf-8")
+        path.write_bytes(b"")
 
 
 def load_orders(path: Path) -> List[Dict[str, Any]]:
     """
-    Load all orders from the JSON file at 'path'.
+    Load all orders from the JSON Lines file at 'path'.
+
+    Small files are read in one go; larger ones are memory-mapped and
+    parsed line by line.
 
     Raises:
-        json.JSONDecodeError if the file content is invalid.
+        json.JSONDecodeError if a line is not valid JSON
+        (orjson.JSONDecodeError is a subclass of it).
     """
-    text = path.read_text(encoding="utf-8")
-    return json.loads(text)
+    with path.open("rb") as f:
+        if os.fstat(f.fileno()).st_size < _MMAP_MIN_SIZE:
+            return _parse_orders(f.read())
+
+        # The mapping reads straight from the OS page cache: the file is
+        # never copied as a whole, only one line at a time.
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if _is_legacy_list(mm):
+                with memoryview(mm) as view:
+                    return _loads(view)
+            return [_loads(line) for line in iter(mm.readline, b"") if line.strip()]
+
+
+def _parse_orders(data: bytes) -> List[Dict[str, Any]]:
+    """Parse the orders from the full contents of a (small) orders file."""
+    if _is_legacy_list(data):
+        # older format: the whole file is one JSON list
+        return _loads(data)
+    return [_loads(line) for line in data.splitlines() if line.strip()]
 
 
 def save_orders(path: Path, orders: List[Dict[str, Any]]) -> None:
     """
-    Save the list of orders to the JSON file at 'path'.
+    Save (overwrite) the list of orders to the JSON Lines file at 'path'.
+
+    Written compactly (no indentation): fewer bytes to encode and write.
+
+    The saved ids may differ from what the id counter expects, so the
+    counter is dropped; allocate_id() rebuilds it from the highest id.
+    """
+    path.write_bytes(b"".join(_dumps(order) + b"\n" for order in orders))
+    _next_id_path(path).unlink(missing_ok=True)
+
+
+def append_order(path: Path, order: Dict[str, Any]) -> None:
     """
-    text = json.dumps(orders, indent=2)
-    path.write_text(text, encoding="utf-8")
+    Add one order to the end of the file at 'path' (created if missing).
+
+    Only the new line is written - existing orders are not read or
+    rewritten, so adding an order costs the same however many exist.
+    An older single-list file is converted to JSON Lines first (once),
+    since a line appended after "]" would make it unreadable.
+    """
+    if _starts_with_list(path):
+        save_orders(path, load_orders(path))
+    with path.open("ab") as f:
+        f.write(_dumps(order) + b"\n")
+
+
+def _starts_with_list(path: Path) -> bool:
+    """True if the file at 'path' is in the older one-JSON-list format."""
+    try:
+        with path.open("rb") as f:
+            # only read up to the first non-whitespace byte
+            for chunk in iter(partial(f.read, 64), b""):
+                chunk = chunk.lstrip()
+                if chunk:
+                    return chunk.startswith(b"[")
+    except FileNotFoundError:
+        pass
+    return False
+
+
+@lru_cache(maxsize=8)
+def _load_indexed(
+    path_str: str, mtime_ns: int, size: int
+) -> Dict[str, List[Dict[str, Any]]]:
+    """
+    Load the orders and group them by customer, cached per file version.
+
+    The file's mtime and size are part of the cache key, so any write to
+    the file (append or rewrite) automatically leads to a fresh load.
+    Callers must not modify the returned data - use orders_by_customer().
+    """
+    index: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    for order in load_orders(Path(path_str)):
+        index[order["customer"]].append(order)
+    return dict(index)
+
+
+def orders_by_customer(path: Path, customer: str) -> List[Dict[str, Any]]:
+    """
+    Return (copies of) all orders of 'customer' in the file at 'path'.
+
+    Uses a cached customer -> orders index, so repeated queries against an
+    unchanged file don't re-read and re-scan it.
+    """
+    st = path.stat()
+    index = _load_indexed(str(path), st.st_mtime_ns, st.st_size)
+    return [dict(o) for o in index.get(customer, ())]
+
+
+def _next_id_path(path: Path) -> Path:
+    """Sidecar file next to the orders file, e.g. orders.json.next_id."""
+    return path.with_name(path.name + ".next_id")
+
+
+def allocate_id(path: Path) -> int:
+    """
+    Reserve and return the next order id for the orders file at 'path'.
+
+    The next free id is kept in a tiny sidecar file, so this costs the same
+    no matter how many orders exist. If the sidecar is missing (an older
+    orders file, or one just rewritten by save_orders), it is rebuilt
+    once from the highest existing id.
+    """
+    id_path = _next_id_path(path)
+    try:
+        new_id = int(id_path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        try:
+            orders = load_orders(path)
+        except FileNotFoundError:
+            orders = []
+        new_id = (max(o["id"] for o in orders) + 1) if orders else 1
+
+    id_path.write_text(str(new_id + 1), encoding="utf-8")
+    return new_id
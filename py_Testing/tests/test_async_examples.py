@@ -10,6 +10,7 @@ from src.async_examples import (
     async_add,
     delayed_double,
     fetch_and_upper,
+    fetch_and_upper_many,
     wait_for_value,
 )
 
@@ -51,11 +52,15 @@ async def test_wait_for_value_timeout():
 # 3) Async fixture using pytest-asyncio
 # -----------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def prepared_number():
     """
     Example async fixture: simulates async setup,
     then provides a value to tests.
+
+    scope="session": the setup runs once for the whole test run and the
+    value is shared, instead of sleeping again for every test that uses it.
+    Fine here because the value (an int) can't be modified by a test.
     """
     await asyncio.sleep(0.01)
     return 7
@@ -72,12 +77,28 @@ async def test_async_fixture_works(prepared_number):
 # 4) Using AsyncMock for async dependencies
 # -----------------------------------------------------------------------------
 
-@pytest_asyncio.fixture
-async def fake_async_client():
+@pytest_asyncio.fixture(scope="session")
+async def shared_async_client():
     """
-    Async fixture returning an AsyncMock that behaves like AsyncClient.
+    One AsyncMock for the whole session (building mocks isn't free).
+    Tests should use fake_async_client below, which resets it first.
     """
-    client = AsyncMock()
+    return AsyncMock()
+
+
+@pytest.fixture
+def fake_async_client(shared_async_client):
+    """
+    AsyncMock that behaves like AsyncClient, reset for each test.
+
+    A mock remembers its calls, so a shared one must be reset or
+    assert_awaited_once_with would see calls from earlier tests.
+    reset_mock() does not clear return_value/side_effect, so we set
+    those explicitly too.
+    """
+    client = shared_async_client
+    client.reset_mock()
+    client.get_data.side_effect = None
     # Configure the async method: when awaited, it should return this value.
     client.get_data.return_value = "hello async"
     return client
@@ -96,12 +117,12 @@ async def test_fetch_and_upper_with_asyncmock(fake_async_client):
 
 
 @pytest.mark.asyncio
-async def test_fetch_and_upper_different_values():
+async def test_fetch_and_upper_different_values(fake_async_client):
     """
-    Same function as above, but we manually create an AsyncMock inside the test
-    and use side_effect to return different values.
+    Same function as above, but side_effect makes the (shared, reset)
+    AsyncMock return different values on each await.
     """
-    client = AsyncMock()
+    client = fake_async_client
     client.get_data.side_effect = ["foo", "bar"]
 
     r1 = await fetch_and_upper(client, "k1")
@@ -112,3 +133,46 @@ async def test_fetch_and_upper_different_values():
     assert client.get_data.await_count == 2
     client.get_data.assert_any_await("k1")
     client.get_data.assert_any_await("k2")
+
+
+@pytest.mark.asyncio
+async def test_fetch_and_upper_many_keeps_order_and_limits_concurrency(
+    fake_async_client,
+):
+    """
+    fetch_and_upper_many runs the fetches concurrently, but never more
+    than 'concurrency' at a time. side_effect is an async function here,
+    so we can count how many calls are in flight.
+    """
+    in_flight = 0
+    peak = 0
+
+    async def fake_get_data(key):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return f"value-{key}"
+
+    client = fake_async_client
+    client.get_data.side_effect = fake_get_data
+
+    keys = [f"k{i}" for i in range(10)]
+    result = await fetch_and_upper_many(client, keys, concurrency=3)
+
+    assert result == [f"VALUE-K{i}" for i in range(10)]
+    assert client.get_data.await_count == 10
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("concurrency", [0, -1])
+async def test_fetch_and_upper_many_rejects_invalid_concurrency(
+    fake_async_client, concurrency
+):
+    # Semaphore(0) would make every fetch wait forever.
+    with pytest.raises(ValueError):
+        await fetch_and_upper_many(fake_async_client, ["k1"], concurrency=concurrency)
+
+    fake_async_client.get_data.assert_not_awaited()
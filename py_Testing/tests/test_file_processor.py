@@ -1,27 +1,30 @@
+import io
 from unittest.mock import MagicMock
-from src.file_processor import read_file_lines, count_file_lines
 
+import pytest
 
-def test_read_file_lines_magicmock():
-    # Create a MagicMock representing a file-like object
-    fake_file = MagicMock()
+from src.file_processor import read_file_lines, count_file_lines, count_file_lines_fast
 
-    # MagicMock already has __enter__ because it's a magic method.
-    # We set __enter__ to return an object whose __iter__ returns an iterator.
-    fake_file.__enter__.return_value.__iter__.return_value = iter([
-        " first line\n",
-        " second line\n",
-        " third line\n",
-    ])
+
+def test_read_file_lines_stringio():
+    # io.StringIO is a real in-memory text file: it supports "with" and
+    # line iteration natively (in C), so no mock wiring is needed when the
+    # test only has to feed some lines in.
+    fake_file = io.StringIO(" first line\n second line\n third line\n")
 
     result = read_file_lines(fake_file)
 
     assert result == ["first line", "second line", "third line"]
+    # leaving the "with" block closed it, just like a real file
+    assert fake_file.closed
 
 
 def test_count_file_lines_magicmock():
+    # MagicMock version: every magic method is configured by hand.
     fake_file = MagicMock()
 
+    # MagicMock already has __enter__ because it's a magic method.
+    # We set __enter__ to return an object whose __iter__ returns an iterator.
     fake_file.__enter__.return_value.__iter__.return_value = iter([
         " a\n",
         " b\n",
@@ -34,8 +37,35 @@ def test_count_file_lines_magicmock():
     assert count == 4
 
 
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        pytest.param(b"", 0, id="empty"),
+        pytest.param(b"one line", 1, id="no-trailing-newline"),
+        pytest.param(b"a\nb\nc\n", 3, id="trailing-newline"),
+        pytest.param(b"a\n\nb", 3, id="blank-line"),
+        pytest.param(b"a\r\nb\r\n", 2, id="crlf"),
+        pytest.param(b"a\rb\rc", 1, id="bare-cr-is-not-a-line-end"),
+    ],
+)
+def test_count_file_lines_fast_matches_count_file_lines(tmp_path, content, expected):
+    # count_file_lines_fast works on a real file path (it reads raw bytes),
+    # so here we write a real temporary file instead of using MagicMock.
+    path = tmp_path / "data.txt"
+    path.write_bytes(content)
+
+    assert count_file_lines_fast(path) == expected
+    # Only "\n" ends a line for count_file_lines_fast; newline="\n" makes
+    # text mode agree (by default it would also split on a bare "\r").
+    with open(path, encoding="utf-8", newline="\n") as f:
+        assert count_file_lines(f) == expected
+    # tiny chunks: newlines and the last line end up split across reads
+    assert count_file_lines_fast(path, chunk_size=2) == expected
+
+
 """
-    MagicMock is used here because the function under test uses:
+    MagicMock is used in test_count_file_lines_magicmock because the function
+    under test uses:
     
     with file_obj as f:        -> requires file_obj.__enter__() and __exit__()
         for line in f:         -> requires file_obj.__iter__()
@@ -62,5 +92,9 @@ def test_count_file_lines_magicmock():
     A normal Mock() does NOT have these magic methods, so mocking a file-like
     object would fail. MagicMock provides all magic methods by default, which is
     why it works perfectly for simulating files, context managers, and iteration.
+
+    When the test only needs to feed text in, io.StringIO is simpler (and
+    faster): it is already a file-like object with __enter__, __exit__ and
+    __iter__ implemented, see test_read_file_lines_stringio.
 """
 
@@ -38,6 +38,21 @@ def test_divide_by_zero_raises():
 
     assert "Division by zero" in str(exc_info.value)
 
+@pytest.fixture(scope="session")
+def prime_sieve():
+    """
+    Session-scoped fixture: built ONCE for the whole test run, then shared.
+    prime_sieve[n] is 1 if n is prime (Sieve of Eratosthenes up to 1023).
+    """
+    limit = 1024
+    sieve = bytearray([1]) * limit
+    sieve[0] = sieve[1] = 0
+    for i in range(2, int(limit ** 0.5) + 1):
+        if sieve[i]:
+            sieve[i * i::i] = bytes(len(range(i * i, limit, i)))
+    return sieve
+
+
 @pytest.mark.parametrize(
     "n, expected",
     [
@@ -54,5 +69,49 @@ def test_divide_by_zero_raises():
         (17, True),
     ],
 )
-def test_is_prime_parametrized(n, expected):
-    assert math_utils.is_prime(n) == expected
\ No newline at end of file
+def test_is_prime_parametrized(n, expected, prime_sieve):
+    # The sieve is an independent oracle: it also checks the expected values.
+    assert bool(prime_sieve[n]) == expected
+    assert math_utils.is_prime(n) == expected
+
+
+def _is_prime_reference(n: int) -> bool:
+    return n >= 2 and all(n % d for d in range(2, int(n ** 0.5) + 1))
+
+
+def test_is_prime_matches_reference_across_table_boundary():
+    # is_prime answers small n from a lookup table and larger n by
+    # trial division; check both sides of the switch-over point.
+    for n in list(range(-5, 200)) + list(range(9_900, 10_200)) + [10_007, 1_000_003, 1_000_001]:
+        assert math_utils.is_prime(n) == _is_prime_reference(n), n
+
+
+def test_trial_division_squares_of_primes():
+    # p * p is the first composite the loop only catches at i == p,
+    # the last candidate allowed by the loop condition.
+    for p in (10_007, 99_991, 1_000_003):
+        assert not math_utils.is_prime(p * p)
+        assert math_utils.is_prime(p * p + 2) == _is_prime_reference(p * p + 2)
+
+
+@pytest.mark.skipif(
+    math_utils.njit is None,
+    reason="only the numba-compiled loop uses int64 (pure Python would take minutes)",
+)
+def test_is_prime_near_int64_max():
+    # 2**63 - 25 is the largest prime below 2**63. Past its square root,
+    # i * i no longer fits in int64, so the loop condition must not square i.
+    assert math_utils.is_prime(2**63 - 25)
+    assert not math_utils.is_prime(2**63 - 27)
+
+
+def test_primes_up_to():
+    assert math_utils.primes_up_to(1) == []
+    assert math_utils.primes_up_to(2) == [2]
+    assert math_utils.primes_up_to(30) == [2, 3, 5, 7, 11, 13, 17, 19, 23, 29]
+
+
+def test_is_prime_batch_matches_scalar():
+    numbers = [-3, 0, 1, 2, 17, 18, 9_973, 10_007, 1_000_003]
+    assert math_utils.is_prime_batch(numbers) == [math_utils.is_prime(n) for n in numbers]
+    assert math_utils.is_prime_batch([]) == []
@@ -3,28 +3,45 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from src.network import fetch_data
+from src.network import TIMEOUT, fetch_data
+
+
+# Patch the shared Session's get() once for the whole module instead of
+# opening a separate patch(...) block in every test.
+@pytest.fixture(scope="module")
+def _patched_session_get():
+    with patch("src.network._SESSION.get") as mock:
+        yield mock
+
+
+@pytest.fixture
+def mock_get(_patched_session_get):
+    """
+    The module-wide mock, reset before each test: call history,
+    side_effect and return_value from the previous test are cleared.
+    """
+    _patched_session_get.reset_mock(return_value=True, side_effect=True)
+    return _patched_session_get
 
 
 # A) side_effect as an exception: simulate network / HTTP error
-def test_fetch_data_raises_error():
+def test_fetch_data_raises_error(mock_get):
     """
     Example A:
     side_effect is set to an exception, so the mock raises it
     when called. We use this to test error handling without
     making a real HTTP request.
     """
-    with patch("src.network.requests.get") as mock_get:
-        mock_get.side_effect = requests.exceptions.HTTPError("Network boom")
+    mock_get.side_effect = requests.exceptions.HTTPError("Network boom")
 
-        with pytest.raises(requests.exceptions.HTTPError):
-            fetch_data("https://example.com")
+    with pytest.raises(requests.exceptions.HTTPError):
+        fetch_data("https://example.com")
 
-    mock_get.assert_called_once_with("https://example.com")
+    mock_get.assert_called_once_with("https://example.com", timeout=TIMEOUT)
 
 
 # B) side_effect as a sequence: multiple different responses
-def test_fetch_data_multiple_responses():
+def test_fetch_data_multiple_responses(mock_get):
     """
     Example B:
     side_effect is a list. Each call to the mock returns the next
@@ -41,21 +58,20 @@ def test_fetch_data_multiple_responses():
     fake_response_2.raise_for_status.return_value = None
     fake_response_2.text = "second call"
 
-    with patch("src.network.requests.get") as mock_get:
-        mock_get.side_effect = [fake_response_1, fake_response_2]
+    mock_get.side_effect = [fake_response_1, fake_response_2]
 
-        r1 = fetch_data("https://example.com/1")
-        r2 = fetch_data("https://example.com/2")
+    r1 = fetch_data("https://example.com/1")
+    r2 = fetch_data("https://example.com/2")
 
     assert r1 == "first call"
     assert r2 == "second call"
     assert mock_get.call_count == 2
-    mock_get.assert_any_call("https://example.com/1")
-    mock_get.assert_any_call("https://example.com/2")
+    mock_get.assert_any_call("https://example.com/1", timeout=TIMEOUT)
+    mock_get.assert_any_call("https://example.com/2", timeout=TIMEOUT)
 
 
 # C) side_effect as a callable: custom logic based on arguments
-def test_fetch_data_custom_side_effect():
+def test_fetch_data_custom_side_effect(mock_get):
     """
     Example C:
     side_effect is a function. The mock will CALL this function
@@ -64,7 +80,7 @@ def test_fetch_data_custom_side_effect():
     depending on the URL.
     """
 
-    def fake_get(url: str):
+    def fake_get(url: str, timeout=None):
         # Raise an error for certain URLs
         if "bad" in url:
             raise ValueError("invalid url")
@@ -79,15 +95,16 @@ def test_fetch_data_custom_side_effect():
         resp.text = f"DATA:{url}"
         return resp
 
-    with patch("src.network.requests.get", side_effect=fake_get) as mock_get:
-        ok_result = fetch_data("good-url")
-        assert ok_result == "DATA:good-url"
+    mock_get.side_effect = fake_get
+
+    ok_result = fetch_data("good-url")
+    assert ok_result == "DATA:good-url"
 
-        # Now the fake_get will raise ValueError for "bad" in url
-        with pytest.raises(ValueError):
-            fetch_data("bad-url")
+    # Now the fake_get will raise ValueError for "bad" in url
+    with pytest.raises(ValueError):
+        fetch_data("bad-url")
 
     # The mock still tracks how it was called
     assert mock_get.call_count == 2
-    mock_get.assert_any_call("good-url")
-    mock_get.assert_any_call("bad-url")
+    mock_get.assert_any_call("good-url", timeout=TIMEOUT)
+    mock_get.assert_any_call("bad-url", timeout=TIMEOUT)
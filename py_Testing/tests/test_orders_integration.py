@@ -3,10 +3,11 @@ Integration tests for the orders system.
 
 Here we test:
 - services.create_order() + storage working together
-- Real JSON read/write on disk (using pytest's tmp_path fixture)
+- Real JSON Lines read/write on disk (using pytest's tmp_path fixture)
 - No mocks: this is closer to a real-world scenario than a unit test
 """
 
+import json
 from pathlib import Path
 
 import pytest
@@ -56,7 +57,10 @@ def test_storage_file_is_valid_json(tmp_path: Path):
     # Create one order
     services.create_order(storage_path, customer="Charlie", amount=123.45)
 
-    # The file should contain valid JSON list of orders.
+    # The file should contain one valid JSON object per line (JSON Lines).
+    lines = storage_path.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["customer"] for line in lines] == ["Charlie"]
+
     # We call storage.load_orders() directly to simulate another part of
     # the application that also uses the storage layer.
     orders = storage.load_orders(storage_path)
@@ -65,3 +69,135 @@ def test_storage_file_is_valid_json(tmp_path: Path):
     assert len(orders) == 1
     assert orders[0]["customer"] == "Charlie"
     assert orders[0]["amount"] == 123.45
+
+
+@pytest.mark.integration
+def test_ids_continue_for_existing_file_without_counter(tmp_path: Path):
+    # An orders file written before the id counter existed:
+    # the next id must still follow the highest stored id.
+    storage_path = tmp_path / "orders.json"
+    storage.save_orders(storage_path, [{"id": 7, "customer": "Dana", "amount": 1.0}])
+
+    order = services.create_order(storage_path, customer="Eve", amount=2.0)
+    next_order = services.create_order(storage_path, customer="Eve", amount=3.0)
+
+    assert order["id"] == 8
+    assert next_order["id"] == 9
+
+
+@pytest.mark.integration
+def test_customer_lookup_sees_new_orders(tmp_path: Path):
+    # get_orders_for_customer caches an index of the file; writing a new
+    # order must invalidate it.
+    storage_path = tmp_path / "orders.json"
+    services.create_order(storage_path, customer="Frank", amount=10.0)
+    assert len(services.get_orders_for_customer(storage_path, "Frank")) == 1
+
+    services.create_order(storage_path, customer="Frank", amount=20.0)
+    frank_orders = services.get_orders_for_customer(storage_path, "Frank")
+
+    assert [o["amount"] for o in frank_orders] == [10.0, 20.0]
+    assert services.get_orders_for_customer(storage_path, "Nobody") == []
+
+
+@pytest.mark.integration
+def test_lookup_without_storage_file_does_not_create_it(tmp_path: Path):
+    storage_path = tmp_path / "orders.json"
+
+    assert services.get_orders_for_customer(storage_path, "Alice") == []
+    assert not storage_path.exists()
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("legacy_list", [False, True], ids=["ndjson", "json-list"])
+def test_load_large_orders_file(tmp_path: Path, legacy_list: bool):
+    # Files from _MMAP_MIN_SIZE bytes on are memory-mapped instead of read
+    # in one go; both paths must give the same orders, for both formats.
+    storage_path = tmp_path / "orders.json"
+    orders = [{"id": i, "customer": f"c{i % 7}", "amount": i * 1.5} for i in range(500)]
+    if legacy_list:
+        storage_path.write_text(json.dumps(orders, indent=2), encoding="utf-8")
+    else:
+        storage.save_orders(storage_path, orders)
+    assert storage_path.stat().st_size >= storage._MMAP_MIN_SIZE
+
+    assert storage.load_orders(storage_path) == orders
+
+
+@pytest.mark.integration
+def test_ids_stay_unique_after_save_orders(tmp_path: Path):
+    # save_orders can write any ids; the next create_order must not reuse one.
+    storage_path = tmp_path / "orders.json"
+    services.create_order(storage_path, customer="Gina", amount=1.0)
+    storage.save_orders(
+        storage_path,
+        [{"id": i, "customer": "Gina", "amount": 1.0} for i in (1, 2, 3)],
+    )
+
+    order = services.create_order(storage_path, customer="Gina", amount=2.0)
+
+    assert order["id"] == 4
+    assert [o["id"] for o in storage.load_orders(storage_path)] == [1, 2, 3, 4]
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize(
+    "content",
+    [
+        pytest.param("[]", id="empty-list"),
+        pytest.param(
+            json.dumps([{"id": 1, "customer": "Hank", "amount": 5.0}], indent=2),
+            id="indented-list",
+        ),
+    ],
+)
+def test_create_order_converts_older_list_file(tmp_path: Path, content: str):
+    # Files written before JSON Lines hold one JSON list; appending a line
+    # after the closing "]" would break them, so they are converted first.
+    storage_path = tmp_path / "orders.json"
+    storage_path.write_text(content, encoding="utf-8")
+    existing = json.loads(content)
+
+    order = services.create_order(storage_path, customer="Hank", amount=7.0)
+
+    assert storage.load_orders(storage_path) == existing + [order]
+    assert services.get_orders_for_customer(storage_path, "Hank") == existing + [order]
+    assert order["id"] == len(existing) + 1
+    # converting rewrote the file; ids must still continue from there
+    next_order = services.create_order(storage_path, customer="Hank", amount=8.0)
+    assert next_order["id"] == order["id"] + 1
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("count", [1, 200], ids=["small-file", "mapped-file"])
+def test_load_orders_skips_blank_lines(tmp_path: Path, count: int):
+    # Empty and whitespace-only lines are ignored the same way whether the
+    # file is read in one go or memory-mapped.
+    storage_path = tmp_path / "orders.json"
+    orders = [{"id": i, "customer": "Ivy", "amount": 1.0} for i in range(count)]
+    lines = [json.dumps(o) for o in orders]
+    storage_path.write_text("\n  \n\n".join(lines) + "\n \n", encoding="utf-8")
+
+    assert (storage_path.stat().st_size >= storage._MMAP_MIN_SIZE) == (count > 1)
+    assert storage.load_orders(storage_path) == orders
+
+
+@pytest.mark.integration
+def test_storage_works_without_orjson(tmp_path: Path, monkeypatch):
+    # orjson is optional: without it storage falls back to the stdlib json.
+    monkeypatch.setattr(storage, "orjson", None)
+    storage_path = tmp_path / "orders.json"
+    orders = [{"id": i, "customer": f"c{i % 3}", "amount": i / 2} for i in range(300)]
+
+    storage.save_orders(storage_path, orders[:-1])
+    storage.append_order(storage_path, orders[-1])
+    assert storage_path.stat().st_size >= storage._MMAP_MIN_SIZE
+    assert storage.load_orders(storage_path) == orders
+
+    # large older list file: parsed from a memoryview of the mapping
+    storage_path.write_text(json.dumps(orders), encoding="utf-8")
+    assert storage.load_orders(storage_path) == orders
+
+    # small file: read in one go
+    storage.save_orders(storage_path, orders[:2])
+    assert storage.load_orders(storage_path) == orders[:2]
@@ -1,4 +1,6 @@
+import itertools
 import math
+
 import pytest
 
 from src import param_examples as pe
@@ -181,6 +183,19 @@ class TestIsPositiveClass:
             assert pe.is_positive(value) is False
 
 
+def test_is_positive_array_matches_scalar():
+    """The batch version must agree with is_positive() for every value."""
+    values = list(range(-100, 100)) + [1.5, -2.0, 0.0, 1e-9]
+    assert pe.is_positive_array(values) == [pe.is_positive(v) for v in values]
+
+
+def test_is_positive_array_numpy():
+    """With NumPy, the whole array is compared in one vectorized call."""
+    np = pytest.importorskip("numpy")
+    values = np.arange(-100, 100)
+    assert (pe.is_positive_array(values) == (values > 0)).all()
+
+
 # ---------------------------------------------------------------------------
 # 7) Indirect parametrization: parameters go into fixture
 # ---------------------------------------------------------------------------
@@ -188,7 +203,7 @@ class TestIsPositiveClass:
 @pytest.fixture
 def user(request):
     """
-    'user' fixture that builds a user dict based on request.param.
+    'user' fixture that builds a User based on request.param.
     The parameter passed from @pytest.mark.parametrize is not the
     final user object, but configuration for this fixture.
     """
@@ -209,37 +224,44 @@ def test_indirect_user_fixture(user):
     """
     The 'user' parameter here is the result of the 'user' fixture,
     not the raw tuple. 'indirect=True' passes the tuples to the
-    fixture via request.param, and the fixture builds the dict.
+    fixture via request.param, and the fixture builds the User.
     """
-    assert "name" in user
-    assert "active" in user
-    assert isinstance(user["name"], str)
-    assert isinstance(user["active"], bool)
+    assert isinstance(user, pe.User)
+    assert isinstance(user.name, str)
+    assert isinstance(user.active, bool)
+    assert user._asdict() == {"name": user.name, "active": user.active}
 
 
 # ---------------------------------------------------------------------------
-# 8) Combining multiple @parametrize decorators (Cartesian product)
+# 8) Cartesian product of parameters
 # ---------------------------------------------------------------------------
 
-@pytest.mark.parametrize("a", [1, 2])
-@pytest.mark.parametrize("b", [10, 20])
+# Stacking decorators also produces every combination:
+#
+#     @pytest.mark.parametrize("a", [1, 2])
+#     @pytest.mark.parametrize("b", [10, 20])
+#
+# but pytest then builds the product itself while collecting, one
+# decorator at a time. itertools.product builds the same flat list of
+# (a, b) pairs once at import time, and pytest just reads it.
+
+@pytest.mark.parametrize("a, b", list(itertools.product([1, 2], [10, 20])))
 def test_multiply_cartesian(a, b):
     """
     This test runs 4 times with combinations:
-        (b=10, a=1)
-        (b=20, a=1)
-        (b=10, a=2)
-        (b=20, a=2)
-
-    Note: pytest applies the decorators from bottom to top.
+        (a=1, b=10)
+        (a=1, b=20)
+        (a=2, b=10)
+        (a=2, b=20)
     """
     result = pe.multiply(a, b)
     assert result == a * b
 
 
 # Another Cartesian example with strings
-@pytest.mark.parametrize("prefix", ["dev", "prod"])
-@pytest.mark.parametrize("suffix", ["api", "web"])
+@pytest.mark.parametrize(
+    "prefix, suffix", list(itertools.product(["dev", "prod"], ["api", "web"]))
+)
 def test_combine_strings(prefix, suffix):
     """
     Cartesian product again:
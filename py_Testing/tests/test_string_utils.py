@@ -4,21 +4,24 @@ from src import string_utils
 
 
 def test_download_text_mocked():
-    # Create a fake "response" object that will mimic what requests.get() returns.
+    # Create a fake "response" object that will mimic what Session.get() returns.
     fake_response = Mock()
     fake_response.text = "hello world"
     fake_response.raise_for_status.return_value = None
 
-    # Any call to requests.get() during this context will return fake_response.
-    with patch("src.string_utils.requests.get", return_value=fake_response) as mock_get:
+    # Any call to the module's shared Session.get() during this context
+    # will return fake_response.
+    with patch("src.string_utils._SESSION.get", return_value=fake_response) as mock_get:
         # Call the function under test.
-        # It will internally call requests.get(), but we’ve replaced that call
+        # It will internally call _SESSION.get(), but we’ve replaced that call
         # with our fake version, so no real HTTP request is made.
         result = string_utils.download_text("https://example.com")
 
     assert result == "hello world"
-    # Make sure requests.get() was called exactly once, with the expected URL.
-    mock_get.assert_called_once_with("https://example.com")
+    # Make sure Session.get() was called exactly once, with the expected URL.
+    mock_get.assert_called_once_with(
+        "https://example.com", timeout=string_utils.TIMEOUT
+    )
 
 
 